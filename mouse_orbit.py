@@ -3,11 +3,13 @@
 import ctypes
 import ctypes.wintypes as wintypes
 import math
-import queue
 import random
 import threading
 import time
+from array import array
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable
 
 import tkinter as tk
@@ -39,6 +41,9 @@ VK_A = 0x41
 VK_S = 0x53
 VK_D = 0x44
 VK_B = 0x42
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+INFINITE = 0xFFFFFFFF
 
 
 @dataclass
@@ -74,6 +79,17 @@ DANGER_COLOR = "#ef4444"
 TEXT_BRIGHT = "#e2e8f0"
 TEXT_MUTED = "#94a3b8"
 
+# (seed mask, control points per second) per channel, in sample_all order.
+ORBIT_NOISE_CHANNELS: tuple[tuple[int, float], ...] = (
+    (0x13579BDF, 0.12),  # radius
+    (0x2468ACE0, 0.08),  # tilt
+    (0x55AA55AA, 0.05),  # precession
+    (0x92E1103A, 0.03),  # center drift x
+    (0x7F4A1BC2, 0.028),  # center drift y
+    (0x6C3D2E1F, 0.11),  # spin
+    (0x0A0B0C0D, 0.25),  # wobble
+)
+
 
 class POINT(ctypes.Structure):
     _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
@@ -108,79 +124,130 @@ class INPUT(ctypes.Structure):
     _fields_ = [("type", ctypes.c_uint), ("union", INPUTUNION)]
 
 
+@lru_cache(maxsize=None)
+def _input_user32() -> "ctypes.WinDLL":
+    """Loads user32 with SendInput/GetCursorPos prototyped for the input hot path."""
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    user32.SendInput.argtypes = [wintypes.UINT, ctypes.c_void_p, ctypes.c_int]
+    user32.SendInput.restype = wintypes.UINT
+    user32.GetCursorPos.argtypes = [ctypes.POINTER(POINT)]
+    user32.GetCursorPos.restype = wintypes.BOOL
+    return user32
+
+
 def _catmull_rom(p0: float, p1: float, p2: float, p3: float, t: float) -> float:
-    t2 = t * t
-    t3 = t2 * t
-    return 0.5 * (
-        (2.0 * p1)
-        + (-p0 + p2) * t
-        + (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * t2
-        + (-p0 + 3.0 * p1 - 3.0 * p2 + p3) * t3
-    )
+    b0 = ((2.0 - t) * t - 1.0) * t
+    b1 = (3.0 * t - 5.0) * t * t + 2.0
+    b2 = ((4.0 - 3.0 * t) * t + 1.0) * t
+    b3 = (t - 1.0) * t * t
+    return 0.5 * (p0 * b0 + p1 * b1 + p2 * b2 + p3 * b3)
 
 
 class SmoothNoise:
     """Generates smooth pseudo-random curves using cached value noise."""
 
+    _block_size = 256
+
     def __init__(self, seed: int) -> None:
         self._rand = random.Random(seed)
-        self._cache: dict[int, float] = {}
+        self._values = array("d")
+        self._origin = 0
+
+    def _draw(self, count: int) -> array:
+        # Same values as Random.uniform(-1.0, 1.0), drawn a block at a time.
+        rand = self._rand.random
+        return array("d", [2.0 * rand() - 1.0 for _ in range(count)])
+
+    def _discard_before(self, index: int) -> None:
+        stale = index - self._origin
+        if stale > 0:
+            del self._values[:stale]
+            self._origin = index
 
     def _value(self, index: int) -> float:
-        if index not in self._cache:
-            self._cache[index] = self._rand.uniform(-1.0, 1.0)
-        return self._cache[index]
+        values = self._values
+        if not values:
+            self._origin = index
+        offset = index - self._origin
+        if offset >= len(values):
+            values.extend(self._draw(offset - len(values) + self._block_size))
+        return values[offset]
 
     def sample(self, position: float) -> float:
         base = math.floor(position)
         t = position - base
-        p0 = self._value(base - 1)
-        p1 = self._value(base)
-        p2 = self._value(base + 1)
-        p3 = self._value(base + 2)
+        offset = base - 1 - self._origin
+        window = self._values[offset : offset + 4] if offset >= 0 else ()
+        if len(window) == 4:
+            p0, p1, p2, p3 = window
+        else:
+            self._discard_before(base - 1)
+            p0 = self._value(base - 1)
+            p1 = self._value(base)
+            p2 = self._value(base + 1)
+            p3 = self._value(base + 2)
         return _catmull_rom(p0, p1, p2, p3, t)
 
 
+class NoiseBank:
+    """Samples a fixed set of SmoothNoise channels at a shared point in time."""
+
+    def __init__(self, seed: int, channels: tuple[tuple[int, float], ...]) -> None:
+        self._channels = tuple((SmoothNoise(seed ^ mask).sample, rate) for mask, rate in channels)
+
+    def sample_all(self, time_s: float) -> list[float]:
+        return [sample(time_s * rate) for sample, rate in self._channels]
+
+
 class InputController:
     """Dispatches relative mouse movement using SendInput."""
 
     def __init__(self) -> None:
-        self._user32 = ctypes.windll.user32
+        self._user32 = _input_user32()
+        self._send_input = self._user32.SendInput
+        self._get_cursor_pos = self._user32.GetCursorPos
         try:
             self._user32.SetProcessDPIAware()
         except AttributeError:
             pass
+        self._packet = INPUT(type=INPUT_MOUSE)
+        self._packet.union.mi.dwFlags = MOUSEEVENTF_MOVE
+        self._mouse = self._packet.union.mi
+        self._packet_ref = ctypes.byref(self._packet)
+        self._packet_size = ctypes.sizeof(INPUT)
+        self._point = POINT()
+        self._point_ref = ctypes.byref(self._point)
 
     def move(self, dx: float, dy: float) -> None:
-        ix = int(round(dx))
-        iy = int(round(dy))
+        self.move_int(int(round(dx)), int(round(dy)))
+
+    def move_int(self, ix: int, iy: int) -> None:
         if ix == 0 and iy == 0:
             return
-        mouse_input = MOUSEINPUT(dx=ix, dy=iy, mouseData=0, dwFlags=MOUSEEVENTF_MOVE, time=0, dwExtraInfo=0)
-        packet = INPUT(type=INPUT_MOUSE, union=INPUTUNION(mi=mouse_input))
-        sent = self._user32.SendInput(1, ctypes.byref(packet), ctypes.sizeof(INPUT))
+        self._mouse.dx = ix
+        self._mouse.dy = iy
+        sent = self._send_input(1, self._packet_ref, self._packet_size)
         if sent != 1:
-            raise ctypes.WinError()
+            raise ctypes.WinError(ctypes.get_last_error())
 
     def position(self) -> tuple[float, float]:
-        point = POINT()
-        if not self._user32.GetCursorPos(ctypes.byref(point)):
-            raise ctypes.WinError()
-        return float(point.x), float(point.y)
+        if not self._get_cursor_pos(self._point_ref):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return float(self._point.x), float(self._point.y)
 
 
 class KeyboardController:
     """Sends quick virtual-key taps using SendInput."""
 
     def __init__(self) -> None:
-        self._user32 = ctypes.windll.user32
+        self._send_input = _input_user32().SendInput
 
     def _send(self, key_code: int, flags: int) -> None:
         keyboard_input = KEYBDINPUT(wVk=key_code, wScan=0, dwFlags=flags, time=0, dwExtraInfo=0)
         packet = INPUT(type=INPUT_KEYBOARD, union=INPUTUNION(ki=keyboard_input))
-        sent = self._user32.SendInput(1, ctypes.byref(packet), ctypes.sizeof(INPUT))
+        sent = self._send_input(1, ctypes.byref(packet), ctypes.sizeof(INPUT))
         if sent != 1:
-            raise ctypes.WinError()
+            raise ctypes.WinError(ctypes.get_last_error())
 
     def press(self, key_code: int) -> None:
         self._send(key_code, 0)
@@ -189,6 +256,48 @@ class KeyboardController:
         self._send(key_code, KEYEVENTF_KEYUP)
 
 
+class PrecisionTimer:
+    """Sleeps on a high-resolution waitable timer, falling back to time.sleep."""
+
+    def __init__(self) -> None:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateWaitableTimerExW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD]
+        kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        kernel32.SetWaitableTimer.argtypes = [
+            wintypes.HANDLE,
+            ctypes.POINTER(wintypes.LARGE_INTEGER),
+            wintypes.LONG,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            wintypes.BOOL,
+        ]
+        kernel32.SetWaitableTimer.restype = wintypes.BOOL
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        self._kernel32 = kernel32
+        self._due = wintypes.LARGE_INTEGER()
+        # High-resolution timers need Windows 10 1803+; older builds return NULL here.
+        self._handle = kernel32.CreateWaitableTimerExW(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS)
+
+    def sleep(self, seconds: float) -> None:
+        if seconds <= 0.0:
+            return
+        if self._handle:
+            # Negative due times are relative, in 100 ns units.
+            self._due.value = -int(seconds * 10_000_000)
+            if self._kernel32.SetWaitableTimer(self._handle, ctypes.byref(self._due), 0, None, None, False):
+                self._kernel32.WaitForSingleObject(self._handle, INFINITE)
+                return
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        if self._handle:
+            self._kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+
 class HotkeyMonitor(threading.Thread):
     """Listens for Ctrl+Alt+Q using RegisterHotKey."""
 
@@ -254,27 +363,29 @@ class OrbitMover:
         self._saccade_interval_range = config.saccade_interval_range
         self._input = InputController()
         self._keyboard = KeyboardController()
+        self._timer = PrecisionTimer()
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._move_loop, daemon=True)
         self._hotkeys = HotkeyMonitor(self._stop_event)
         self._screen_w, self._screen_h = _screen_bounds()
+        margin = config.screen_margin
+        self._min_x = margin
+        self._min_y = margin
+        self._max_x = max(margin, self._screen_w - margin)
+        self._max_y = max(margin, self._screen_h - margin)
         seed = random.randrange(1 << 30)
-        self._noise_radius = SmoothNoise(seed ^ 0x13579BDF)
-        self._noise_tilt = SmoothNoise(seed ^ 0x2468ACE0)
-        self._noise_precession = SmoothNoise(seed ^ 0x55AA55AA)
-        self._noise_center_x = SmoothNoise(seed ^ 0x92E1103A)
-        self._noise_center_y = SmoothNoise(seed ^ 0x7F4A1BC2)
-        self._noise_spin = SmoothNoise(seed ^ 0x6C3D2E1F)
-        self._noise_wobble = SmoothNoise(seed ^ 0x0A0B0C0D)
+        self._noise = NoiseBank(seed, ORBIT_NOISE_CHANNELS)
         self._step_keys = [VK_W, VK_A, VK_S, VK_D]
         self._active_step_key: int | None = None
-        self._step_hold_remaining = 0.0
-        self._time_until_step = self._next_step_interval() if self._enable_steps else math.inf
+        # Key timers are absolute deadlines in session seconds, measured from loop start.
+        self._step_release_at = 0.0
+        self._next_step_at = self._next_step_interval() if self._enable_steps else math.inf
         self._b_interval = 180.0
         self._b_duration = 4.0
-        self._b_time_until_press = self._b_interval if self._enable_b_hold else math.inf
-        self._b_hold_remaining = 0.0
+        self._b_press_at = self._b_interval if self._enable_b_hold else math.inf
+        self._b_release_at = 0.0
         self._b_active = False
+        self._cursor_sync_interval = 2.0
 
     def _next_step_interval(self) -> float:
         low, high = self._step_interval_range
@@ -308,7 +419,7 @@ class OrbitMover:
             except OSError:
                 pass
             self._b_active = False
-        self._b_time_until_press = self._b_interval if self._enable_b_hold else math.inf
+        self._b_press_at = math.inf
 
     def _move_loop(self) -> None:
         theta = random.random() * math.tau
@@ -316,7 +427,11 @@ class OrbitMover:
         bias = random.uniform(0.05, 0.18)
         prev_x = 0.0
         prev_y = 0.0
-        elapsed = 0.0
+        cursor_x = 0.0
+        cursor_y = 0.0
+        next_cursor_sync = 0.0
+        frac_x = 0.0
+        frac_y = 0.0
         cycle_blend = 1.0
         radius_gain = 1.0
         target_radius_gain = 1.0 + random.uniform(-0.05, 0.05)
@@ -329,30 +444,64 @@ class OrbitMover:
         saccade_offset_x = 0.0
         saccade_offset_y = 0.0
         saccade_decay = 0.0
-        time_until_saccade = (
-            random.uniform(*self._saccade_interval_range)
-            if self._enable_saccades
+        cfg = self._config
+        wobble_bias = cfg.wobble_vertical_bias
+        spin_noise = cfg.spin_noise_scale
+        enable_steps = self._enable_steps
+        enable_saccades = self._enable_saccades
+        enable_b_hold = self._enable_b_hold
+        step_keys = self._step_keys
+        saccade_low, saccade_high = self._saccade_interval_range
+        next_saccade_at = (
+            random.uniform(saccade_low, saccade_high)
+            if enable_saccades
             else math.inf
         )
+        radius_floor = 0.78 * self.base_radius
+        radius_swing = 0.22 * self.base_radius
+        radius_noise_amp = 0.12 * self.base_radius
+        drift_amp = 0.14 * self.base_radius
+        center_amp = 0.1 * self.base_radius
+        wobble_amp = cfg.wobble_scale * self.jitter
+        jitter_amp = self.jitter * cfg.jitter_random_scale
+        theta_step = self.angular_velocity * self.interval
+        min_x, max_x = self._min_x, self._max_x
+        min_y, max_y = self._min_y, self._max_y
+        sin = math.sin
+        cos = math.cos
+        exp = math.exp
+        rand = random.random
+        uniform = random.uniform
+        choice = random.choice
+        sample_noise = self._noise.sample_all
+        move_int = self._input.move_int
+        smoothing = 1.0
+        # Session time sums measured tick steps, capped so a stall cannot jump the curves.
+        clock_ns = time.perf_counter_ns
+        tick_ns = int(self.interval * 1e9)
+        max_step = 4.0 * self.interval
+        last_ns = clock_ns()
+        next_tick_ns = last_ns
+        slow_time = 0.0
         try:
             while not self._stop_event.is_set():
-                elapsed += self.interval
-                slow_time = elapsed
-                if self._enable_steps:
-                    self._time_until_step -= self.interval
-                    if self._active_step_key is None and self._time_until_step <= 0.0:
-                        candidate = random.choice(self._step_keys)
+                now_ns = clock_ns()
+                dt = min((now_ns - last_ns) * 1e-9, max_step)
+                last_ns = now_ns
+                slow_time += dt
+                if enable_steps:
+                    if self._active_step_key is None and slow_time >= self._next_step_at:
+                        candidate = choice(step_keys)
                         try:
                             self._keyboard.press(candidate)
                         except OSError:
-                            self._time_until_step = self._next_step_interval()
+                            self._next_step_at = slow_time + self._next_step_interval()
                         else:
                             self._active_step_key = candidate
-                            self._step_hold_remaining = self._next_step_hold()
-                            self._time_until_step = self._next_step_interval()
+                            self._step_release_at = slow_time + self._next_step_hold()
+                            self._next_step_at = slow_time + self._next_step_interval()
                     elif self._active_step_key is not None:
-                        self._step_hold_remaining -= self.interval
-                        if self._step_hold_remaining <= 0.0:
+                        if slow_time >= self._step_release_at:
                             try:
                                 self._keyboard.release(self._active_step_key)
                             except OSError:
@@ -364,73 +513,79 @@ class OrbitMover:
                     except OSError:
                         pass
                     self._active_step_key = None
-                if self._enable_b_hold:
-                    self._b_time_until_press -= self.interval
-                    if not self._b_active and self._b_time_until_press <= 0.0:
+                if enable_b_hold:
+                    if not self._b_active and slow_time >= self._b_press_at:
                         try:
                             self._keyboard.press(VK_B)
                         except OSError:
-                            self._b_time_until_press = self._b_interval
+                            self._b_press_at = slow_time + self._b_interval
                         else:
                             self._b_active = True
-                            self._b_hold_remaining = self._b_duration
+                            self._b_release_at = slow_time + self._b_duration
                     elif self._b_active:
-                        self._b_hold_remaining -= self.interval
-                        if self._b_hold_remaining <= 0.0:
+                        if slow_time >= self._b_release_at:
                             try:
                                 self._keyboard.release(VK_B)
                             except OSError:
                                 pass
                             self._b_active = False
-                            self._b_time_until_press = self._b_interval
+                            self._b_press_at = slow_time + self._b_interval
                 elif self._b_active:
                     try:
                         self._keyboard.release(VK_B)
                     except OSError:
                         pass
                     self._b_active = False
-                    self._b_time_until_press = math.inf
+                    self._b_press_at = math.inf
                 if cycle_blend < 1.0:
-                    cycle_blend = min(1.0, cycle_blend + self.interval * 0.35)
-                smoothing = 0.5 - 0.5 * math.cos(math.pi * cycle_blend)
+                    cycle_blend = min(1.0, cycle_blend + dt * 0.35)
+                    smoothing = 0.5 - 0.5 * cos(math.pi * cycle_blend)
                 gain = radius_gain + (target_radius_gain - radius_gain) * smoothing
                 blended_tilt = tilt_offset + (target_tilt_offset - tilt_offset) * smoothing
                 blended_center_x = center_offset_x + (target_center_offset_x - center_offset_x) * smoothing
                 blended_center_y = center_offset_y + (target_center_offset_y - center_offset_y) * smoothing
-                dynamic_radius = self.base_radius * (0.78 + 0.22 * math.sin(theta * 2.7 + phase))
-                radius_offset = 0.12 * self.base_radius * self._noise_radius.sample(slow_time * 0.12)
-                vertical_scale = 0.65 + 0.35 * math.cos(theta * 1.4 + phase * 0.5 + blended_tilt + 0.4 * self._noise_tilt.sample(slow_time * 0.08))
-                precession = 0.9 * self._noise_precession.sample(slow_time * 0.05)
-                cos_prec = math.cos(precession)
-                sin_prec = math.sin(precession)
-                base_x = (dynamic_radius + radius_offset) * math.cos(theta)
-                base_y = (dynamic_radius * vertical_scale) * math.sin(theta)
+                (
+                    noise_radius,
+                    noise_tilt,
+                    noise_precession,
+                    noise_center_x,
+                    noise_center_y,
+                    noise_spin,
+                    noise_wobble,
+                ) = sample_noise(slow_time)
+                dynamic_radius = radius_floor + radius_swing * sin(theta * 2.7 + phase)
+                radius_offset = radius_noise_amp * noise_radius
+                vertical_scale = 0.65 + 0.35 * cos(theta * 1.4 + phase * 0.5 + blended_tilt + 0.4 * noise_tilt)
+                precession = 0.9 * noise_precession
+                cos_prec = cos(precession)
+                sin_prec = sin(precession)
+                base_x = (dynamic_radius + radius_offset) * cos(theta)
+                base_y = (dynamic_radius * vertical_scale) * sin(theta)
                 base_x *= gain
                 base_y *= gain
                 rotated_x = cos_prec * base_x - sin_prec * base_y
                 rotated_y = sin_prec * base_x + cos_prec * base_y
-                drift_x = 0.14 * self.base_radius * self._noise_center_x.sample(slow_time * 0.03)
-                drift_y = 0.14 * self.base_radius * self._noise_center_y.sample(slow_time * 0.028)
-                wobble = self._config.wobble_scale * self.jitter * self._noise_wobble.sample(slow_time * 0.25)
+                drift_x = drift_amp * noise_center_x
+                drift_y = drift_amp * noise_center_y
+                wobble = wobble_amp * noise_wobble
                 fine_x = rotated_x + drift_x + blended_center_x + wobble
-                fine_y = rotated_y + drift_y + blended_center_y + self._config.wobble_vertical_bias * wobble
-                fine_x += (random.random() - 0.5) * self.jitter * self._config.jitter_random_scale
-                fine_y += (random.random() - 0.5) * self.jitter * self._config.jitter_random_scale
-                if self._enable_saccades:
-                    time_until_saccade -= self.interval
-                    if time_until_saccade <= 0.0:
-                        saccade_offset_x = random.uniform(-8.0, 8.0)
-                        saccade_offset_y = random.uniform(-5.0, 5.0)
+                fine_y = rotated_y + drift_y + blended_center_y + wobble_bias * wobble
+                fine_x += (rand() - 0.5) * jitter_amp
+                fine_y += (rand() - 0.5) * jitter_amp
+                if enable_saccades:
+                    if slow_time >= next_saccade_at:
+                        saccade_offset_x = uniform(-8.0, 8.0)
+                        saccade_offset_y = uniform(-5.0, 5.0)
                         saccade_decay = 0.0
-                        time_until_saccade = random.uniform(*self._saccade_interval_range)
+                        next_saccade_at = slow_time + uniform(saccade_low, saccade_high)
                 else:
                     saccade_offset_x = 0.0
                     saccade_offset_y = 0.0
-                if self._enable_saccades and (saccade_offset_x or saccade_offset_y):
-                    decay_factor = math.exp(-6.0 * saccade_decay)
+                if enable_saccades and (saccade_offset_x or saccade_offset_y):
+                    decay_factor = exp(-6.0 * saccade_decay)
                     fine_x += saccade_offset_x * decay_factor
                     fine_y += saccade_offset_y * decay_factor
-                    saccade_decay += self.interval
+                    saccade_decay += dt
                     if decay_factor < 0.02:
                         saccade_offset_x = 0.0
                         saccade_offset_y = 0.0
@@ -440,28 +595,48 @@ class OrbitMover:
                 dy = y - prev_y
                 prev_x = x
                 prev_y = y
-                current_x, current_y = self._input.position()
-                target_x, target_y = current_x + dx, current_y + dy
-                clamped_x, clamped_y = self._clamp_to_screen(target_x, target_y)
-                self._input.move(clamped_x - current_x, clamped_y - current_y)
-                spin_variation = 1.0 + bias * math.sin(theta * 0.9 + phase)
-                spin_variation += self._config.spin_noise_scale * self._noise_spin.sample(slow_time * 0.11)
-                theta += self.angular_velocity * self.interval * spin_variation
+                if slow_time >= next_cursor_sync:
+                    cursor_x, cursor_y = self._input.position()
+                    next_cursor_sync = slow_time + self._cursor_sync_interval
+                target_x = cursor_x + dx
+                target_y = cursor_y + dy
+                clamped_x = min_x if target_x < min_x else (max_x if target_x > max_x else target_x)
+                clamped_y = min_y if target_y < min_y else (max_y if target_y > max_y else target_y)
+                total_dx = clamped_x - cursor_x + frac_x
+                total_dy = clamped_y - cursor_y + frac_y
+                pixel_dx = round(total_dx)
+                pixel_dy = round(total_dy)
+                frac_x = total_dx - pixel_dx
+                frac_y = total_dy - pixel_dy
+                if pixel_dx or pixel_dy:
+                    move_int(pixel_dx, pixel_dy)
+                    cursor_x += pixel_dx
+                    cursor_y += pixel_dy
+                spin_variation = 1.0 + bias * sin(theta * 0.9 + phase)
+                spin_variation += spin_noise * noise_spin
+                theta += theta_step * spin_variation
                 if theta > math.tau:
                     theta -= math.tau
                     radius_gain = target_radius_gain
                     tilt_offset = target_tilt_offset
                     center_offset_x = target_center_offset_x
                     center_offset_y = target_center_offset_y
-                    target_radius_gain = 1.0 + random.uniform(-0.05, 0.05)
-                    target_tilt_offset = random.uniform(-0.3, 0.3)
-                    target_center_offset_x = random.uniform(-1.0, 1.0) * 0.1 * self.base_radius
-                    target_center_offset_y = random.uniform(-1.0, 1.0) * 0.1 * self.base_radius
-                    phase += random.uniform(-0.25, 0.25)
-                    bias = random.uniform(0.04, 0.19)
+                    target_radius_gain = 1.0 + uniform(-0.05, 0.05)
+                    target_tilt_offset = uniform(-0.3, 0.3)
+                    target_center_offset_x = uniform(-1.0, 1.0) * center_amp
+                    target_center_offset_y = uniform(-1.0, 1.0) * center_amp
+                    phase += uniform(-0.25, 0.25)
+                    bias = uniform(0.04, 0.19)
                     cycle_blend = 0.0
-                time.sleep(self.interval)
+                next_tick_ns += tick_ns
+                sleep_ns = next_tick_ns - clock_ns()
+                if sleep_ns > 0:
+                    self._timer.sleep(sleep_ns * 1e-9)
+                elif sleep_ns < -tick_ns:
+                    # Fell behind (e.g. the machine stalled); resume from now.
+                    next_tick_ns = clock_ns()
         finally:
+            self._timer.close()
             if self._active_step_key is not None:
                 try:
                     self._keyboard.release(self._active_step_key)
@@ -475,14 +650,6 @@ class OrbitMover:
                     pass
                 self._b_active = False
 
-    def _clamp_to_screen(self, x: float, y: float) -> tuple[float, float]:
-        margin = self._config.screen_margin
-        max_x = max(margin, self._screen_w - margin)
-        max_y = max(margin, self._screen_h - margin)
-        clamped_x = max(margin, min(max_x, x))
-        clamped_y = max(margin, min(max_y, y))
-        return clamped_x, clamped_y
-
 
 class AutoAFKApp:
     """High polish Tkinter control deck for the AutoAFK choreography."""
@@ -491,15 +658,49 @@ class AutoAFKApp:
         self.root = root
         self.config = OrbitConfig()
         self.vars: dict[str, tk.Variable] = {}
+        self._var_names: dict[str, str] = {}
         self._interactive_widgets: list[ttk.Widget] = []
+        self._controls_scripts: tuple[str, str] | None = None
         self._value_labels: dict[str, tk.StringVar] = {}
         self._value_formatters: dict[str, Callable[[float], str]] = {}
-        self._queue: queue.Queue[tuple[str, object]] = queue.Queue()
+        self._value_label_cache: dict[str, str] = {}
+        self._slider_resolutions: dict[str, float] = {}
+        self._last_slider_values: dict[str, int] = {}
+        self._range_cache: dict[tuple[str, str], tuple[tuple[object, object], tuple[float, float]]] = {}
+        self._queue: deque[tuple[str, object]] = deque()
         self._session_thread: threading.Thread | None = None
+        self._countdown_after_id: str | None = None
+        self._countdown_deadline = 0.0
+        self._countdown_total = 0.0
         self._session_stop_event = threading.Event()
         self._mover: OrbitMover | None = None
-        self._summary_after_id: str | None = None
+        self._ui_dirty: set[str] = set()
+        self._ui_flush_after: str | None = None
+        self._ui_flush_ms = 16
+        self._ui_handlers: dict[str, Callable[[], None]] = {"summary": self._refresh_summary}
+        self._summary_prev_lines: list[str] = []
+        self._summary_fmts: dict[str, Callable[..., str]] = {
+            "base_radius": "- Orbit radius: {:.0f} px".format,
+            "angular_velocity": "- Camera pace: {:.2f} rad/s".format,
+            "jitter": "- Motion texture: {:.1f} px".format,
+            "startup_delay": "- Startup countdown: {:.1f} s".format,
+            "screen_margin": "- Screen margin: {:.0f} px".format,
+            "step_interval": "    cadence window: {:.1f}s – {:.1f}s".format,
+            "step_hold": "    tap length window: {:.2f}s – {:.2f}s".format,
+            "saccade_interval": "    interval window: {:.1f}s – {:.1f}s".format,
+        }
         self.status_var = tk.StringVar(value="Session idle.")
+        # Worker threads can only post Tk events on a thread-enabled Tcl.
+        self._event_wakeups = bool(self.root.tk.call("info", "exists", "tcl_platform(threaded)"))
+        self._poll_empty_streak = 0
+        self._poll_after_id: str | None = None
+        self._processing_queue = False
+        self._closing = False
+        self._progress_mode = "determinate"
+        self._spin_refresh_cmd = self.root.register(lambda: self._mark_dirty("summary"))
+        self._spin_bindtag = "AutoAFKSpin"
+        self.root.bind_class(self._spin_bindtag, "<FocusOut>", self._on_spin_focus_out)
+        self.root.bind_class(self._spin_bindtag, "<Return>", self._on_spin_return)
 
         self.root.title(APP_NAME)
         self.root.minsize(1180, 660)
@@ -512,7 +713,9 @@ class AutoAFKApp:
         self._refresh_summary()
 
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
-        self._poll_queue()
+        self.root.bind("<<MoverEvent>>", self._on_mover_event)
+        if not self._event_wakeups:
+            self._poll_queue()
 
     def _build_style(self) -> None:
         style = ttk.Style()
@@ -587,11 +790,14 @@ class AutoAFKApp:
 
     def _bind_var(self, key: str, var: tk.Variable) -> None:
         self.vars[key] = var
+        self._var_names[key] = str(var)
         var.trace_add("write", lambda *_args, name=key: self._on_var_change(name))
 
     def _on_var_change(self, key: str) -> None:
+        if not self._slider_value_changed(key):
+            return
         self._update_value_label(key)
-        self._refresh_summary_debounced()
+        self._mark_dirty("summary")
 
     def _build_ui(self) -> None:
         outer = ttk.Frame(self.root, style="AutoAFK.TFrame", padding=(28, 24))
@@ -605,9 +811,7 @@ class AutoAFKApp:
 
         content = ttk.Frame(outer, style="AutoAFK.TFrame")
         content.pack(fill="both", expand=True)
-        content.columnconfigure(0, weight=1, uniform="col")
-        content.columnconfigure(1, weight=1, uniform="col")
-        content.columnconfigure(2, weight=1, uniform="col")
+        content.columnconfigure((0, 1, 2), weight=1, uniform="col")
 
         left_panel = ttk.Frame(content, style="Card.TFrame", padding=(24, 22))
         left_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
@@ -765,15 +969,14 @@ class AutoAFKApp:
             textvariable=self.vars[key],
             width=8,
             justify="center",
+            command=self._spin_refresh_cmd,
         )
         spin.pack(anchor="e")
-        spin.configure(command=self._refresh_summary_debounced)
-        spin.bind("<FocusOut>", lambda _event: self._refresh_summary_debounced())
-        spin.bind("<Return>", lambda event: (event.widget.selection_clear(), self._refresh_summary_debounced()))
-        self._interactive_widgets.append(spin)
+        self._wire_spin(spin)
 
         self._value_labels[key] = value_var
         self._value_formatters[key] = formatter
+        self._slider_resolutions[key] = resolution
         self._update_value_label(key)
 
     def _build_range_inputs(
@@ -798,6 +1001,7 @@ class AutoAFKApp:
             textvariable=self.vars[min_key],
             width=8,
             justify="center",
+            command=self._spin_refresh_cmd,
         )
         min_spin.grid(row=1, column=0, sticky="we", pady=(6, 0))
 
@@ -809,20 +1013,29 @@ class AutoAFKApp:
             textvariable=self.vars[max_key],
             width=8,
             justify="center",
+            command=self._spin_refresh_cmd,
         )
         max_spin.grid(row=1, column=1, sticky="we", padx=(12, 0), pady=(6, 0))
 
-        container.columnconfigure(0, weight=1)
-        container.columnconfigure(1, weight=1)
+        container.columnconfigure((0, 1), weight=1)
 
-        for spin in (min_spin, max_spin):
-            spin.configure(command=self._refresh_summary_debounced)
-            spin.bind("<FocusOut>", lambda _event: self._refresh_summary_debounced())
-            spin.bind("<Return>", lambda event: (event.widget.selection_clear(), self._refresh_summary_debounced()))
-            self._interactive_widgets.append(spin)
+        self._wire_spin(min_spin)
+        self._wire_spin(max_spin)
 
         ttk.Label(container, text="Values auto-sort on launch.", style="Muted.TLabel", wraplength=320).grid(row=2, column=0, columnspan=2, sticky="w", pady=(4, 0))
 
+    def _wire_spin(self, spin: ttk.Spinbox) -> None:
+        tags = spin.bindtags()
+        spin.bindtags((tags[0], self._spin_bindtag) + tags[1:])
+        self._interactive_widgets.append(spin)
+
+    def _on_spin_focus_out(self, _event: tk.Event) -> None:
+        self._mark_dirty("summary")
+
+    def _on_spin_return(self, event: tk.Event) -> None:
+        event.widget.selection_clear()
+        self._mark_dirty("summary")
+
     def _build_summary_panel(self, parent: ttk.Frame) -> None:
         badge = tk.Label(
             parent,
@@ -875,8 +1088,7 @@ class AutoAFKApp:
 
         control_bar = ttk.Frame(parent, style="Card.TFrame")
         control_bar.pack(fill="x", pady=(4, 0))
-        control_bar.columnconfigure(0, weight=1)
-        control_bar.columnconfigure(1, weight=1)
+        control_bar.columnconfigure((0, 1), weight=1)
 
         self.start_button = ttk.Button(control_bar, text="Engage Orbit", style="Accent.TButton", command=self._start_session)
         self.start_button.grid(row=0, column=0, sticky="ew")
@@ -886,8 +1098,24 @@ class AutoAFKApp:
         self.stop_button.state(["disabled"])
 
     def _on_slider(self, key: str) -> None:
+        if not self._slider_value_changed(key):
+            return
         self._update_value_label(key)
-        self._refresh_summary_debounced()
+        self._mark_dirty("summary")
+
+    def _slider_value_changed(self, key: str) -> bool:
+        # Scales report sub-pixel positions; react only when a resolution step is crossed.
+        resolution = self._slider_resolutions.get(key)
+        if resolution is None:
+            return True
+        try:
+            step = round(float(self.vars[key].get()) / resolution)
+        except (TypeError, ValueError, tk.TclError):
+            return True
+        if self._last_slider_values.get(key) == step:
+            return False
+        self._last_slider_values[key] = step
+        return True
 
     def _update_value_label(self, key: str) -> None:
         if key in self._value_labels:
@@ -897,31 +1125,42 @@ class AutoAFKApp:
                 return
             formatter = self._value_formatters.get(key)
             if formatter:
-                self._value_labels[key].set(formatter(value))
-
-    def _refresh_summary_debounced(self) -> None:
-        if self._summary_after_id is not None:
-            self.root.after_cancel(self._summary_after_id)
-        self._summary_after_id = self.root.after(120, self._refresh_summary)
+                text = formatter(value)
+                if text == self._value_label_cache.get(key):
+                    return
+                self._value_label_cache[key] = text
+                self._value_labels[key].set(text)
+
+    def _mark_dirty(self, key: str) -> None:
+        self._ui_dirty.add(key)
+        if self._ui_flush_after is None:
+            self._ui_flush_after = self.root.after(self._ui_flush_ms, self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        self._ui_flush_after = None
+        dirty = self._ui_dirty
+        self._ui_dirty = set()
+        for key in dirty:
+            self._ui_handlers[key]()
 
     def _refresh_summary(self) -> None:
-        self._summary_after_id = None
         snapshot = self._build_config_from_vars()
+        fmts = self._summary_fmts
 
         lines = [
-            f"- Orbit radius: {snapshot.base_radius:.0f} px",
-            f"- Camera pace: {snapshot.angular_velocity:.2f} rad/s",
-            f"- Motion texture: {snapshot.jitter:.1f} px",
-            f"- Startup countdown: {snapshot.startup_delay:.1f} s",
-            f"- Screen margin: {snapshot.screen_margin:.0f} px",
+            fmts["base_radius"](snapshot.base_radius),
+            fmts["angular_velocity"](snapshot.angular_velocity),
+            fmts["jitter"](snapshot.jitter),
+            fmts["startup_delay"](snapshot.startup_delay),
+            fmts["screen_margin"](snapshot.screen_margin),
         ]
 
         if snapshot.enable_keyboard_steps:
             lines.extend(
                 [
                     "- Walkabout footwork: Enabled",
-                    f"    cadence window: {snapshot.step_interval_range[0]:.1f}s – {snapshot.step_interval_range[1]:.1f}s",
-                    f"    tap length window: {snapshot.step_hold_range[0]:.2f}s – {snapshot.step_hold_range[1]:.2f}s",
+                    fmts["step_interval"](*snapshot.step_interval_range),
+                    fmts["step_hold"](*snapshot.step_hold_range),
                 ]
             )
         else:
@@ -931,7 +1170,7 @@ class AutoAFKApp:
             lines.extend(
                 [
                     "- Micro-saccades: Enabled",
-                    f"    interval window: {snapshot.saccade_interval_range[0]:.1f}s – {snapshot.saccade_interval_range[1]:.1f}s",
+                    fmts["saccade_interval"](*snapshot.saccade_interval_range),
                 ]
             )
         else:
@@ -947,51 +1186,65 @@ class AutoAFKApp:
         else:
             lines.append("- Utility stance: Disabled")
 
+        self._render_summary_lines(lines)
+
+    def _render_summary_lines(self, lines: list[str]) -> None:
+        previous = self._summary_prev_lines
+        if lines == previous:
+            return
+        shared = min(len(lines), len(previous))
+        first = 0
+        while first < shared and lines[first] == previous[first]:
+            first += 1
+        tail = 0
+        while tail < shared - first and lines[-1 - tail] == previous[-1 - tail]:
+            tail += 1
+
+        chunks: list[object] = []
+        for line in lines[first : len(lines) - tail]:
+            chunks.extend((line + "\n", "detail" if line.startswith("    ") else ()))
+
+        start, end = f"{first + 1}.0", f"{len(previous) - tail + 1}.0"
         self.summary_text.configure(state="normal")
-        self.summary_text.delete("1.0", "end")
-        for line in lines:
-            if line.startswith("    "):
-                self.summary_text.insert("end", line + "\n", "detail")
-            else:
-                self.summary_text.insert("end", line + "\n")
+        if chunks:
+            self.summary_text.replace(start, end, *chunks)
+        else:
+            self.summary_text.delete(start, end)
         self.summary_text.configure(state="disabled")
+        self._summary_prev_lines = lines
+
+    def _snapshot_vars(self) -> dict[str, object]:
+        read = self.root.tk.globalgetvar
+        return {key: read(name) for key, name in self._var_names.items()}
 
     def _build_config_from_vars(self) -> OrbitConfig:
+        snap = self._snapshot_vars()
+        as_bool = self.root.tk.getboolean
+        as_float = self.root.tk.getdouble
         cfg = OrbitConfig()
-        cfg.enable_keyboard_steps = bool(self.vars["enable_steps"].get())
-        cfg.enable_saccades = bool(self.vars["enable_saccades"].get())
-        cfg.enable_b_hold = bool(self.vars["enable_b_hold"].get())
-        cfg.base_radius = float(self.vars["base_radius"].get())
-        cfg.angular_velocity = float(self.vars["angular_velocity"].get())
-        cfg.jitter = float(self.vars["jitter"].get())
-        cfg.startup_delay = float(self.vars["startup_delay"].get())
-        cfg.screen_margin = float(self.vars["screen_margin"].get())
-        cfg.step_interval_range = tuple(
-            sorted(
-                (
-                    float(self.vars["step_interval_min"].get()),
-                    float(self.vars["step_interval_max"].get()),
-                )
-            )
-        )
-        cfg.step_hold_range = tuple(
-            sorted(
-                (
-                    float(self.vars["step_hold_min"].get()),
-                    float(self.vars["step_hold_max"].get()),
-                )
-            )
-        )
-        cfg.saccade_interval_range = tuple(
-            sorted(
-                (
-                    float(self.vars["saccade_interval_min"].get()),
-                    float(self.vars["saccade_interval_max"].get()),
-                )
-            )
-        )
+        cfg.enable_keyboard_steps = as_bool(snap["enable_steps"])
+        cfg.enable_saccades = as_bool(snap["enable_saccades"])
+        cfg.enable_b_hold = as_bool(snap["enable_b_hold"])
+        cfg.base_radius = as_float(snap["base_radius"])
+        cfg.angular_velocity = as_float(snap["angular_velocity"])
+        cfg.jitter = as_float(snap["jitter"])
+        cfg.startup_delay = as_float(snap["startup_delay"])
+        cfg.screen_margin = as_float(snap["screen_margin"])
+        cfg.step_interval_range = self._sorted_range(snap, "step_interval_min", "step_interval_max")
+        cfg.step_hold_range = self._sorted_range(snap, "step_hold_min", "step_hold_max")
+        cfg.saccade_interval_range = self._sorted_range(snap, "saccade_interval_min", "saccade_interval_max")
         return cfg
 
+    def _sorted_range(self, snap: dict[str, object], min_key: str, max_key: str) -> tuple[float, float]:
+        raw = (snap[min_key], snap[max_key])
+        cached = self._range_cache.get((min_key, max_key))
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        as_float = self.root.tk.getdouble
+        bounds = tuple(sorted((as_float(raw[0]), as_float(raw[1]))))
+        self._range_cache[(min_key, max_key)] = (raw, bounds)
+        return bounds
+
     def _collect_config(self) -> OrbitConfig:
         cfg = self._build_config_from_vars()
         self.vars["step_interval_min"].set(cfg.step_interval_range[0])
@@ -1004,31 +1257,26 @@ class AutoAFKApp:
         return cfg
 
     def _drain_queue(self) -> None:
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        self._queue.clear()
 
     def _set_controls_enabled(self, enabled: bool) -> None:
-        for widget in self._interactive_widgets:
-            try:
-                if enabled:
-                    widget.state(["!disabled"])
-                else:
-                    widget.state(["disabled"])
-            except tk.TclError:
-                widget.configure(state="normal" if enabled else "disabled")
-
-        if enabled:
-            self.start_button.state(["!disabled"])
-            self.stop_button.state(["disabled"])
-        else:
-            self.start_button.state(["disabled"])
-            self.stop_button.state(["!disabled"])
+        if self._controls_scripts is None:
+            paths = [str(widget) for widget in self._interactive_widgets]
+            enable = [f"{path} state !disabled" for path in paths]
+            enable += [f"{self.start_button} state !disabled", f"{self.stop_button} state disabled"]
+            disable = [f"{path} state disabled" for path in paths]
+            disable += [f"{self.start_button} state disabled", f"{self.stop_button} state !disabled"]
+            self._controls_scripts = ("\n".join(disable), "\n".join(enable))
+        disable_script, enable_script = self._controls_scripts
+        self.root.tk.eval(enable_script if enabled else disable_script)
+
+    def _session_active(self) -> bool:
+        if self._countdown_after_id is not None:
+            return True
+        return self._session_thread is not None and self._session_thread.is_alive()
 
     def _start_session(self) -> None:
-        if self._session_thread and self._session_thread.is_alive():
+        if self._session_active():
             messagebox.showinfo("AutoAFK", "A session is already running.")
             return
 
@@ -1037,22 +1285,56 @@ class AutoAFKApp:
 
         self._drain_queue()
         self.status_var.set("Calibrating session envelope...")
-        self.progress.stop()
-        self.progress.configure(mode="determinate", maximum=100, value=0)
+        self._set_progress_determinate(0)
         self._session_stop_event.clear()
         self._set_controls_enabled(False)
 
+        total_delay = max(0.0, config.startup_delay)
+        if total_delay > 0:
+            self._countdown_total = total_delay
+            self._countdown_deadline = time.perf_counter() + total_delay
+            self._tick_countdown()
+        else:
+            self._launch_mover(config)
+
+    def _tick_countdown(self) -> None:
+        remaining = self._countdown_deadline - time.perf_counter()
+        if remaining <= 0.0:
+            self._countdown_after_id = None
+            self._show_countdown(0.0, self._countdown_total)
+            self._launch_mover(self.config)
+            return
+        self._show_countdown(remaining, self._countdown_total)
+        self._countdown_after_id = self.root.after(max(1, int(min(0.1, remaining) * 1000)), self._tick_countdown)
+
+    def _show_countdown(self, remaining: float, total: float) -> None:
+        completion = min(max((total - remaining) / total, 0.0), 1.0)
+        self._set_progress_determinate(completion * 100)
+        if remaining > 0:
+            self.status_var.set(f"Engaging choreography in {remaining:0.1f}s")
+        else:
+            self.status_var.set("Engagement imminent...")
+
+    def _launch_mover(self, config: OrbitConfig) -> None:
+        self._poll_empty_streak = 0
         self._session_thread = threading.Thread(target=self._session_worker, args=(config,), daemon=True)
         self._session_thread.start()
+        if self._poll_after_id is not None:
+            self.root.after_cancel(self._poll_after_id)
+            self._poll_after_id = self.root.after(0, self._poll_queue)
 
     def _stop_session(self) -> None:
-        if not self._session_thread or not self._session_thread.is_alive():
+        if self._countdown_after_id is not None:
+            self.root.after_cancel(self._countdown_after_id)
+            self._countdown_after_id = None
+            self._finish_session("Session canceled before launch.")
+            return
+        if not self._session_active():
             return
         self._session_stop_event.set()
         self.status_var.set("Stopping session...")
         try:
-            self.progress.configure(mode="indeterminate")
-            self.progress.start(14)
+            self._set_progress_indeterminate()
         except tk.TclError:
             pass
         if self._mover is not None:
@@ -1063,17 +1345,6 @@ class AutoAFKApp:
         launched = False
         mover: OrbitMover | None = None
         try:
-            self._post(("status", "Calibrating session envelope..."))
-            total_delay = max(0.0, config.startup_delay)
-            if total_delay > 0:
-                start = time.perf_counter()
-                while not self._session_stop_event.is_set():
-                    elapsed = time.perf_counter() - start
-                    remaining = max(0.0, total_delay - elapsed)
-                    self._post(("countdown", remaining, total_delay))
-                    if remaining <= 0.0:
-                        break
-                    time.sleep(0.1)
             if self._session_stop_event.is_set():
                 status_message = "Session canceled before launch."
                 return
@@ -1101,61 +1372,108 @@ class AutoAFKApp:
             self._post(("done", status_message))
 
     def _post(self, payload: tuple[str, object]) -> None:
-        self._queue.put(payload)
+        self._queue.append(payload)
+        if self._event_wakeups:
+            try:
+                self.root.event_generate("<<MoverEvent>>", when="tail")
+            except (RuntimeError, tk.TclError):
+                pass  # UI is shutting down; nothing left to update.
+
+    def _on_mover_event(self, _event: tk.Event) -> None:
+        self._process_queue()
 
     def _poll_queue(self) -> None:
+        drained = 0
         try:
-            while True:
-                payload = self._queue.get_nowait()
-                kind = payload[0]
-                if kind == "status":
-                    self.status_var.set(payload[1])
-                elif kind == "countdown":
-                    remaining, total = payload[1], payload[2]
-                    if total <= 0:
-                        self.progress.configure(mode="determinate", maximum=100, value=100)
-                        self.status_var.set("Engagement imminent...")
-                    else:
-                        completion = min(max((total - remaining) / total, 0.0), 1.0)
-                        self.progress.configure(mode="determinate", maximum=100)
-                        self.progress["value"] = completion * 100
-                        if remaining > 0:
-                            self.status_var.set(f"Engaging choreography in {remaining:0.1f}s")
-                        else:
-                            self.status_var.set("Engagement imminent...")
-                elif kind == "session_state":
-                    state = payload[1]
-                    if state == "running":
-                        self.progress.configure(mode="indeterminate")
-                        self.progress.start(14)
-                    elif state == "stopped":
-                        self.progress.stop()
-                        self.progress.configure(mode="determinate", maximum=100, value=0)
-                elif kind == "error":
-                    message = payload[1]
-                    self.progress.stop()
-                    messagebox.showerror("AutoAFK", message)
-                    self.status_var.set("Error encountered. Session halted.")
-                elif kind == "done":
-                    message = payload[1] if len(payload) > 1 else "Session idle."
-                    self.progress.stop()
-                    self.progress.configure(mode="determinate", maximum=100, value=0)
-                    self._set_controls_enabled(True)
-                    self.status_var.set(message)  # type: ignore[arg-type]
-                    self._session_thread = None
-                    self._session_stop_event.clear()
-        except queue.Empty:
-            pass
+            drained = self._process_queue()
         finally:
-            self.root.after(80, self._poll_queue)
+            if self._session_thread is None:
+                delay = 1000
+            else:
+                self._poll_empty_streak = 0 if drained else self._poll_empty_streak + 1
+                delay = 40 if self._poll_empty_streak < 4 else 250
+            self._poll_after_id = self.root.after(delay, self._poll_queue)
+
+    def _set_progress_determinate(self, value: float) -> None:
+        if self._progress_mode != "determinate":
+            self.progress.stop()
+            self.progress.configure(mode="determinate", maximum=100)
+            self._progress_mode = "determinate"
+        self.progress["value"] = value
+
+    def _set_progress_indeterminate(self) -> None:
+        if self._progress_mode == "indeterminate":
+            return
+        self.progress.configure(mode="indeterminate")
+        self.progress.start(14)
+        self._progress_mode = "indeterminate"
+
+    def _take_queued(self) -> list[tuple[str, object]]:
+        pending = self._queue
+        popleft = pending.popleft
+        payloads = []
+        while pending:
+            payloads.append(popleft())
+        return payloads
+
+    def _process_queue(self) -> int:
+        # Nested calls, e.g. from the error dialog's event loop, leave the queue to this one.
+        if self._processing_queue:
+            return 0
+        self._processing_queue = True
+        handled = 0
+        try:
+            while self._queue:
+                handled += self._dispatch_payloads(self._take_queued())
+        finally:
+            self._processing_queue = False
+        return handled
+
+    def _dispatch_payloads(self, payloads: list[tuple[str, object]]) -> int:
+        latest_status = max((index for index, payload in enumerate(payloads) if payload[0] == "status"), default=-1)
+        for index, payload in enumerate(payloads):
+            kind = payload[0]
+            if kind == "status":
+                if index == latest_status:
+                    self.status_var.set(payload[1])
+            elif kind == "session_state":
+                state = payload[1]
+                if state == "running":
+                    self._set_progress_indeterminate()
+                elif state == "stopped":
+                    self._set_progress_determinate(0)
+            elif kind == "error":
+                message = payload[1]
+                self.progress.stop()
+                messagebox.showerror("AutoAFK", message)
+                self.status_var.set("Error encountered. Session halted.")
+            elif kind == "done":
+                message = payload[1] if len(payload) > 1 else "Session idle."
+                self._session_thread = None
+                self._finish_session(message)  # type: ignore[arg-type]
+        return len(payloads)
+
+    def _finish_session(self, message: str) -> None:
+        self._set_progress_determinate(0)
+        self._set_controls_enabled(True)
+        self.status_var.set(message)
+        self._session_stop_event.clear()
 
     def _on_close(self) -> None:
-        if self._session_thread and self._session_thread.is_alive():
+        if self._closing:
+            return
+        if self._session_active():
             if not messagebox.askyesno("AutoAFK", "A session is running. Stop and exit?"):
                 return
             self._stop_session()
-            if self._session_thread:
-                self._session_thread.join(timeout=2.0)
+            thread = self._session_thread
+            if thread is not None:
+                # The worker's event_generate blocks until the UI thread handles it.
+                self._closing = True
+                deadline = time.monotonic() + 2.0
+                while thread.is_alive() and time.monotonic() < deadline:
+                    self.root.update()
+                    thread.join(timeout=0.01)
         self.root.destroy()
 
 